@@ -5,6 +5,10 @@ import numpy as np
 from ensmallen import Graph
 from embiggen.utils.abstract_models import AbstractClassifierModel
 
+_MONTE_CARLO_EVALUATION_SCHEMAS = frozenset(("Stratified Monte Carlo", "Monte Carlo"))
+_KFOLD_EVALUATION_SCHEMAS = frozenset(("Stratified Kfold", "Kfold"))
+_STRATIFIED_EVALUATION_SCHEMAS = frozenset(("Stratified Monte Carlo", "Stratified Kfold"))
+
 
 class AbstractEdgeLabelPredictionModel(AbstractClassifierModel):
     """Class defining an abstract edge label prediction model."""
@@ -81,17 +85,17 @@ class AbstractEdgeLabelPredictionModel(AbstractClassifierModel):
         holdouts_kwargs: Dict[str, Any]
             The kwargs to be forwarded to the holdout method.
         """
-        if evaluation_schema in ("Monte Carlo", "Stratified Monte Carlo"):
+        if evaluation_schema in _MONTE_CARLO_EVALUATION_SCHEMAS:
             return graph.get_edge_label_holdout_graphs(
                 **holdouts_kwargs,
-                use_stratification="Stratified" in evaluation_schema,
+                use_stratification=evaluation_schema in _STRATIFIED_EVALUATION_SCHEMAS,
                 random_state=random_state+holdout_number,
             )
-        if evaluation_schema in ("Kfold", "Stratified Kfold"):
+        if evaluation_schema in _KFOLD_EVALUATION_SCHEMAS:
             return graph.get_edge_label_kfold(
                 k=number_of_holdouts,
                 k_index=holdout_number,
-                use_stratification="Stratified" in evaluation_schema,
+                use_stratification=evaluation_schema in _STRATIFIED_EVALUATION_SCHEMAS,
                 random_state=random_state,
             )
         super().split_graph_following_evaluation_schema(
@@ -133,14 +137,20 @@ class AbstractEdgeLabelPredictionModel(AbstractClassifierModel):
         verbose: bool = True,
     ) -> List[Dict[str, Any]]:
         """Return model evaluation on the provided graphs."""
-        train_size = train.get_number_of_known_edge_types() / graph.get_number_of_known_edge_types()
+        # These values do not change between the train and test
+        # evaluations, so we retrieve them from the graph only once.
+        number_of_known_edge_types = graph.get_number_of_known_edge_types()
+        train_size = train.get_number_of_known_edge_types() / number_of_known_edge_types
+        is_binary_prediction_task = self.is_binary_prediction_task()
+        is_multilabel_prediction_task = self.is_multilabel_prediction_task()
 
         performance = []
         for evaluation_mode, evaluation_graph in (
             ("train", train),
             ("test", test),
         ):
-            if evaluation_graph.is_directed():
+            is_directed = evaluation_graph.is_directed()
+            if is_directed:
                 mask = evaluation_graph.get_directed_edges_with_known_edge_types_mask()
             else:
                 mask = evaluation_graph.get_upper_triangular_known_edge_types_mask()
@@ -161,17 +171,24 @@ class AbstractEdgeLabelPredictionModel(AbstractClassifierModel):
                     f"and {mask.shape[0]} edges."
                 )
 
-            prediction_probabilities = prediction_probabilities[mask]
+            # We downcast the prediction probabilities to float32 so that
+            # the following evaluations do not move around twice the bytes
+            # that are actually needed. The labels are kept as the compact
+            # edge type ids, and never expanded into a dense one-hot matrix.
+            prediction_probabilities = prediction_probabilities[mask].astype(
+                np.float32,
+                copy=False
+            )
 
-            if evaluation_graph.is_directed():
+            if is_directed:
                 labels = evaluation_graph.get_directed_known_edge_type_ids()
             else:
                 labels = evaluation_graph.get_upper_triangular_known_edge_type_ids()
             
-            if self.is_binary_prediction_task():
+            if is_binary_prediction_task:
                 predictions = prediction_probabilities
                 labels = labels == 1
-            elif self.is_multilabel_prediction_task():
+            elif is_multilabel_prediction_task:
                 # TODO! support multilabel prediction!
                 raise NotImplementedError(
                     "Currently we do not support multi-label edge-label prediction "
@@ -184,7 +201,7 @@ class AbstractEdgeLabelPredictionModel(AbstractClassifierModel):
             performance.append({
                 "evaluation_mode": evaluation_mode,
                 "train_size": train_size,
-                "known_edges_number": graph.get_number_of_known_edge_types(),
+                "known_edges_number": number_of_known_edge_types,
                 **self.evaluate_predictions(
                     labels,
                     predictions,
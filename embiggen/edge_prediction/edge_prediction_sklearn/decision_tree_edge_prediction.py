@@ -1,5 +1,7 @@
 """Submodule wrapping Decision Tree for edge prediction."""
 from typing import Dict, Any, Union, List
+from multiprocessing import cpu_count
+import numpy as np
 from sklearn.tree import DecisionTreeClassifier
 from embiggen.edge_prediction.edge_prediction_sklearn.sklearn_edge_prediction_adapter import SklearnEdgePredictionAdapter
 from embiggen.utils.normalize_kwargs import normalize_kwargs
@@ -25,9 +27,30 @@ class DecisionTreeEdgePrediction(SklearnEdgePredictionAdapter):
         use_edge_metrics: bool = False,
         use_scale_free_distribution: bool = True,
         prediction_batch_size: int = 2**12,
-        random_state: int = 42
+        random_state: int = 42,
+        n_jobs: int = -1
     ):
-        """Create the Decision Tree for Edge Prediction."""
+        """Create the Decision Tree for Edge Prediction.
+
+        Implementation details
+        ----------------------
+        The prediction of a decision tree releases the GIL, so the
+        prediction batches are run concurrently on `n_jobs` threads.
+        As in joblib, negative values of `n_jobs` count from the number
+        of available cores, so -1 uses all of them and -2 all but one.
+
+        Raises
+        ----------------------
+        ValueError
+            If the provided `n_jobs` is zero.
+        """
+        if n_jobs == 0:
+            raise ValueError(
+                "The provided number of jobs `n_jobs` must be a positive integer, "
+                "or a negative integer to count from the number of available cores, "
+                "but zero was provided."
+            )
+
         self._tree_kwargs = normalize_kwargs(
             self,
             dict(
@@ -56,12 +79,33 @@ class DecisionTreeEdgePrediction(SklearnEdgePredictionAdapter):
             prediction_batch_size=prediction_batch_size,
             random_state=random_state
         )
+        self._n_jobs = n_jobs
+        self._number_of_prediction_threads = (
+            n_jobs if n_jobs > 0 else max(cpu_count() + 1 + n_jobs, 1)
+        )
+
+    def _prepare_features(self, features: np.ndarray) -> np.ndarray:
+        """Returns the features as a C-contiguous float32 array.
+
+        Implementation details
+        ----------------------
+        Sklearn decision trees store their thresholds in float32 and
+        copy any other input into a float32 array before traversing
+        the tree. Converting the features here avoids that hidden copy.
+
+        Parameters
+        --------------------
+        features: np.ndarray
+            The edge features to prepare.
+        """
+        return np.ascontiguousarray(features, dtype=np.float32)
 
     def parameters(self) -> Dict[str, Any]:
         """Returns parameters used for this model."""
         return {
             **super().parameters(),
-            **self._tree_kwargs
+            **self._tree_kwargs,
+            "n_jobs": self._n_jobs,
         }
 
     @classmethod
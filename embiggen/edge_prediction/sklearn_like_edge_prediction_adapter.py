@@ -1,5 +1,7 @@
 """Module providing adapter class making edge prediction possible in sklearn models."""
-from typing import Type, List, Optional, Dict, Any, Union, Tuple
+from typing import Type, List, Optional, Dict, Any, Union, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import numpy as np
 import math
 import compress_pickle
@@ -85,6 +87,10 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
         self._prediction_batch_size = prediction_batch_size
         self._use_edge_metrics = use_edge_metrics
         self._use_scale_free_distribution = use_scale_free_distribution
+        # Number of threads used to run the prediction batches concurrently.
+        # Models whose prediction releases the GIL, such as decision trees,
+        # may increase this value in their own constructor.
+        self._number_of_prediction_threads: int = 1
 
     def parameters(self) -> Dict[str, Any]:
         """Returns parameters used for this model."""
@@ -101,6 +107,23 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
         """Return copy of self."""
         return copy.deepcopy(self)
 
+    def _prepare_features(self, features: np.ndarray) -> np.ndarray:
+        """Returns the features in the format expected by the model.
+
+        Implementation details
+        ----------------------
+        By default the features are returned unchanged. Models that
+        internally convert their inputs to a specific dtype should
+        override this method, so that the conversion happens once
+        and without hidden copies.
+
+        Parameters
+        --------------------
+        features: np.ndarray
+            The edge features to prepare.
+        """
+        return features
+
     def _trasform_graph_into_edge_embedding(
         self,
         graph: Union[Graph, Tuple[np.ndarray]],
@@ -390,16 +413,16 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
                 )
             )
 
-        self._model_instance.fit(
-            *lpt.transform(
-                positive_graph=graph,
-                negative_graph=negative_graph,
-                edge_features=rasterized_edge_features,
-                shuffle=True,
-                random_state=self._random_state,
-            )
+        features, labels = lpt.transform(
+            positive_graph=graph,
+            negative_graph=negative_graph,
+            edge_features=rasterized_edge_features,
+            shuffle=True,
+            random_state=self._random_state,
         )
 
+        self._model_instance.fit(self._prepare_features(features), labels)
+
     def _predict(
         self,
         graph: Graph,
@@ -431,18 +454,24 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
         edge_features: Optional[Union[Type[AbstractEdgeFeature], List[Type[AbstractEdgeFeature]]]] = None
             The edge features to use.
         """
-        return (
-            self.predict_proba(
-                graph=graph,
-                support=support,
-                node_features=node_features,
-                node_type_features=node_type_features,
-                edge_type_features=edge_type_features,
-                edge_features=edge_features,
-            )
-            > 0.5
+        # The features we receive here have already been normalized and
+        # validated by the public `predict` method, so we directly call the
+        # private `_predict_proba` method instead of going through the public
+        # `predict_proba` method, which would normalize and validate them again.
+        prediction_probabilities = self._predict_proba(
+            graph=graph,
+            support=support,
+            node_features=node_features,
+            node_type_features=node_type_features,
+            edge_type_features=edge_type_features,
+            edge_features=edge_features,
         )
 
+        if not isinstance(prediction_probabilities, np.ndarray):
+            prediction_probabilities = np.concatenate(list(prediction_probabilities))
+
+        return prediction_probabilities > 0.5
+
     def _predict_proba(
         self,
         graph: Graph,
@@ -491,7 +520,8 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
             batch_size=self._prediction_batch_size,
         )
 
-        def predict(features):
+        def predict(features: np.ndarray) -> np.ndarray:
+            features = self._prepare_features(features)
             if hasattr(self._model_instance, "predict_proba"):
                 prediction_probabilities = self._model_instance.predict_proba(features)
             else:
@@ -515,8 +545,8 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
 
             return prediction_probabilities
 
-        return (
-            predict(
+        def predict_batch(edges) -> np.ndarray:
+            return predict(
                 self._trasform_graph_into_edge_embedding(
                     graph=(edges[0][0], edges[0][1]),
                     support=support,
@@ -528,15 +558,52 @@ class SklearnLikeEdgePredictionAdapter(AbstractEdgePredictionModel):
                     edge_features=edge_features,
                 )
             )
-            for edges in tqdm(
-                (sequence[i] for i in range(len(sequence))),
-                total=len(sequence),
-                dynamic_ncols=True,
-                desc="Running edge predictions",
-                leave=False,
-            )
+
+        batches = tqdm(
+            (sequence[i] for i in range(len(sequence))),
+            total=len(sequence),
+            dynamic_ncols=True,
+            desc="Running edge predictions",
+            leave=False,
         )
 
+        if self._number_of_prediction_threads == 1:
+            return (predict_batch(edges) for edges in batches)
+
+        return self._iterate_threaded_predictions(predict_batch, batches)
+
+    def _iterate_threaded_predictions(
+        self,
+        predict_batch,
+        batches: Iterator,
+    ) -> Iterator[np.ndarray]:
+        """Yields the predictions of the provided batches, computed in a thread pool.
+
+        Implementation details
+        ----------------------
+        The predictions are yielded in the same order as the batches.
+        At most twice as many batches as threads are kept in flight at
+        any time, so that the memory requirements remain bounded as in
+        the sequential case.
+
+        Parameters
+        --------------------
+        predict_batch: Callable
+            The function to call on each batch.
+        batches: Iterator
+            The batches to run predictions on.
+        """
+        with ThreadPoolExecutor(
+            max_workers=self._number_of_prediction_threads
+        ) as executor:
+            futures = deque()
+            for edges in batches:
+                futures.append(executor.submit(predict_batch, edges))
+                if len(futures) >= 2 * self._number_of_prediction_threads:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+
     @classmethod
     def can_use_edge_weights(cls) -> bool:
         """Returns whether the model can optionally use edge weights."""
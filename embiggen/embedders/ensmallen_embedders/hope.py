@@ -1,10 +1,10 @@
 """Module providing HOPE implementation."""
-from typing import Optional,  Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from ensmallen import Graph
 import pandas as pd
 import numpy as np
 from scipy.sparse import coo_matrix
-from scipy.sparse.linalg import svds as sparse_svds
+from scipy.sparse.linalg import eigsh
 from sklearn.utils.extmath import randomized_svd
 from userinput.utils import must_be_in_set
 from embiggen.embedders.ensmallen_embedders.ensmallen_embedder import EnsmallenEmbedder
@@ -14,6 +14,32 @@ from embiggen.utils import EmbeddingResult
 class HOPEEnsmallen(EnsmallenEmbedder):
     """Class implementing the HOPE algorithm."""
 
+    SPARSE_METRICS = {
+        "Jaccard": "get_jaccard_coo_matrix",
+        "Neighbours Intersection size": "get_neighbours_intersection_size_coo_matrix",
+        "Adamic-Adar": "get_adamic_adar_coo_matrix",
+        "Laplacian": "get_laplacian_coo_matrix",
+        "Left Normalized Laplacian": "get_left_normalized_laplacian_coo_matrix",
+        "Right Normalized Laplacian": "get_right_normalized_laplacian_coo_matrix",
+        "Symmetric Normalized Laplacian": "get_symmetric_normalized_laplacian_coo_matrix",
+    }
+    DENSE_METRICS = {
+        "Shortest Paths": "get_shortest_paths_matrix",
+        "Modularity": "get_dense_modularity_matrix",
+    }
+    ANCESTRAL_METRICS = {
+        "Ancestors Jaccard": "get_shared_ancestors_jaccard_adjacency_matrix",
+        "Ancestors size": "get_shared_ancestors_size_adjacency_matrix",
+    }
+    # Metrics yielding a symmetric matrix on undirected graphs.
+    SYMMETRIC_METRICS = frozenset((
+        "Jaccard",
+        "Adamic-Adar",
+        "Laplacian",
+        "Symmetric Normalized Laplacian",
+        "Neighbours Intersection size",
+    ))
+
     def __init__(
         self,
         embedding_size: int = 100,
@@ -55,13 +81,12 @@ class HOPEEnsmallen(EnsmallenEmbedder):
             store the computed embedding.
         """
         metric = must_be_in_set(metric, self.get_available_metrics(), "metric")
-        ancestral_metric = ("Ancestors Jaccard", "Ancestors size")
-        if root_node_name is None and metric in ancestral_metric:
+        if root_node_name is None and metric in self.ANCESTRAL_METRICS:
             raise ValueError(
                 f"The provided metric is `{metric}`, but "
                 "the root node name was not provided."
             )
-        if root_node_name is not None and metric not in ancestral_metric:
+        if root_node_name is not None and metric not in self.ANCESTRAL_METRICS:
             raise ValueError(
                 "The provided metric is not based on ancestors, but "
                 f"the root node name `{root_node_name}` was provided. It is unclear "
@@ -71,6 +96,10 @@ class HOPEEnsmallen(EnsmallenEmbedder):
         self._metric = metric
         self._root_node_name = root_node_name
         self._verbose = verbose
+        # The breadth first search used by the ancestral metrics
+        # is stored alongside the hash of the graph it was computed on,
+        # so that it is not recomputed when embedding the same graph.
+        self._breadth_first_search_cache: Optional[Tuple[int, Any]] = None
 
         super().__init__(
             embedding_size=embedding_size,
@@ -93,20 +122,34 @@ class HOPEEnsmallen(EnsmallenEmbedder):
     def get_available_metrics(cls) -> List[str]:
         """Returns list of the available metrics."""
         return [
-            "Jaccard",
-            "Shortest Paths",
-            "Neighbours Intersection size",
-            "Ancestors Jaccard",
-            "Ancestors size",
-            "Adamic-Adar",
+            *cls.SPARSE_METRICS,
+            *cls.DENSE_METRICS,
+            *cls.ANCESTRAL_METRICS,
             "Adjacency",
-            "Laplacian",
-            "Modularity",
-            "Left Normalized Laplacian",
-            "Right Normalized Laplacian",
-            "Symmetric Normalized Laplacian",
         ]
 
+    def _get_breadth_first_search(self, graph: Graph) -> Any:
+        """Return the breadth first search from the root node, using cache when possible.
+
+        Parameters
+        --------------------------
+        graph: Graph
+            The graph on which to compute the breadth first search.
+        """
+        graph_hash = graph.hash()
+        if (
+            self._breadth_first_search_cache is None
+            or self._breadth_first_search_cache[0] != graph_hash
+        ):
+            self._breadth_first_search_cache = (
+                graph_hash,
+                graph.get_breadth_first_search_from_node_names(
+                    src_node_name=self._root_node_name,
+                    compute_predecessors=True
+                )
+            )
+        return self._breadth_first_search_cache[1]
+
     def _fit_transform(
         self,
         graph: Graph,
@@ -114,77 +157,101 @@ class HOPEEnsmallen(EnsmallenEmbedder):
     ) -> EmbeddingResult:
         """Return node embedding."""
         matrix = None
-        if self._metric == "Jaccard":
-            edges, weights = graph.get_jaccard_coo_matrix()
-        elif self._metric == "Laplacian":
-            edges, weights = graph.get_laplacian_coo_matrix()
-        elif self._metric == "Shortest Paths":
-            matrix = graph.get_shortest_paths_matrix()
-        elif self._metric == "Modularity":
-            matrix = graph.get_dense_modularity_matrix()
-        elif self._metric == "Left Normalized Laplacian":
-            edges, weights = graph.get_left_normalized_laplacian_coo_matrix()
-        elif self._metric == "Right Normalized Laplacian":
-            edges, weights = graph.get_right_normalized_laplacian_coo_matrix()
-        elif self._metric == "Symmetric Normalized Laplacian":
-            edges, weights = graph.get_symmetric_normalized_laplacian_coo_matrix()
-        elif self._metric == "Neighbours Intersection size":
-            edges, weights = graph.get_neighbours_intersection_size_coo_matrix()
-        elif self._metric == "Ancestors Jaccard":
-            matrix = graph.get_shared_ancestors_jaccard_adjacency_matrix(
-                graph.get_breadth_first_search_from_node_names(
-                    src_node_name=self._root_node_name,
-                    compute_predecessors=True
-                ),
+        if self._metric in self.SPARSE_METRICS:
+            edges, weights = getattr(graph, self.SPARSE_METRICS[self._metric])()
+        elif self._metric in self.DENSE_METRICS:
+            matrix = getattr(graph, self.DENSE_METRICS[self._metric])()
+        elif self._metric in self.ANCESTRAL_METRICS:
+            matrix = getattr(graph, self.ANCESTRAL_METRICS[self._metric])(
+                self._get_breadth_first_search(graph),
                 verbose=self._verbose
             )
-        elif self._metric == "Ancestors size":
-            matrix = graph.get_shared_ancestors_size_adjacency_matrix(
-                graph.get_breadth_first_search_from_node_names(
-                    src_node_name=self._root_node_name,
-                    compute_predecessors=True
-                ),
-                verbose=self._verbose
+        else:
+            # We broadcast a single weight instead of allocating
+            # a vector of ones as large as the number of edges.
+            edges, weights = graph.get_directed_edge_node_ids(), np.broadcast_to(
+                np.float32(1.0),
+                (graph.get_number_of_directed_edges(),)
             )
-        elif self._metric == "Adamic-Adar":
-            edges, weights = graph.get_adamic_adar_coo_matrix()
-        elif self._metric == "Adjacency":
-            edges, weights = graph.get_directed_edge_node_ids(), np.ones(
-                graph.get_number_of_directed_edges())
 
         if matrix is None:
+            # We convert the matrix to CSR, as the randomized SVD
+            # executes several sparse matrix products with it.
             matrix = coo_matrix(
-                (weights, (edges[:, 0], edges[:, 1])),
+                (
+                    weights.astype(np.float32, copy=False),
+                    (
+                        np.ascontiguousarray(edges[:, 0]),
+                        np.ascontiguousarray(edges[:, 1])
+                    )
+                ),
                 shape=(
                     graph.get_number_of_nodes(),
                     graph.get_number_of_nodes()
-                ),
-                dtype=np.float32
-            )
-            
-            U, sigmas, Vt = sparse_svds(
+                )
+            ).tocsr()
+        else:
+            # The dense metrics are decomposed in float32 as well,
+            # which is a no-op when they are already in that dtype.
+            matrix = np.asarray(matrix, dtype=np.float32)
+
+        number_of_components = int(self._embedding_size / 2)
+
+        if (
+            self._metric in self.SYMMETRIC_METRICS
+            and not graph.is_directed()
+            and number_of_components < graph.get_number_of_nodes() - 1
+        ):
+            # On undirected graphs these metrics yield a symmetric matrix,
+            # whose singular values are the absolute values of its eigenvalues,
+            # with the same vectors on both sides up to the eigenvalue sign.
+            # We can therefore run the cheaper Lanczos eigendecomposition.
+            # Since HOPE is not a stocastic model, we use a fixed starting
+            # vector to keep the embedding reproducible.
+            eigenvalues, U = eigsh(
                 matrix,
-                k=int(self._embedding_size / 2)
+                k=number_of_components,
+                which="LM",
+                v0=np.random.RandomState(42).uniform(
+                    -1, 1, graph.get_number_of_nodes()
+                )
             )
+            sigmas = np.abs(eigenvalues)
+            Vt = (U * np.sign(eigenvalues)).T
         else:
+            # The randomized SVD relies on dense matrix products, which
+            # are significantly faster than the Lanczos iterations of ARPACK
+            # on large graphs. Since HOPE is not a stocastic model, we use
+            # a fixed random state to keep the embedding reproducible.
             U, sigmas, Vt = randomized_svd(
                 matrix,
-                n_components=int(self._embedding_size / 2)
+                n_components=number_of_components,
+                n_oversamples=10,
+                n_iter="auto",
+                random_state=42
             )
         
-        sigmas = np.diagflat(np.sqrt(sigmas))
-        left_embedding = np.dot(U, sigmas)
-        right_embedding = np.dot(Vt.T, sigmas)
+        # Scaling the columns by broadcasting is equivalent to the
+        # product with the diagonal matrix of the singular values,
+        # without allocating it or running a full matrix product.
+        sigmas = np.sqrt(sigmas).astype(np.float32, copy=False)
+        left_embedding = U.astype(np.float32, copy=False) * sigmas
+        right_embedding = Vt.T.astype(np.float32, copy=False) * sigmas
 
         if return_dataframe:
-            node_names = graph.get_node_names()
+            # We build the index once and share it between the two
+            # embeddings, and we wrap the freshly computed arrays
+            # without copying them into the DataFrames.
+            node_names = pd.Index(graph.get_node_names())
             left_embedding = pd.DataFrame(
                 left_embedding,
-                index=node_names
+                index=node_names,
+                copy=False
             )
             right_embedding = pd.DataFrame(
                 right_embedding,
-                index=node_names
+                index=node_names,
+                copy=False
             )
         return EmbeddingResult(
             embedding_method_name=self.model_name(),
@@ -102,9 +102,11 @@ class Node2VecEnsmallen(EnsmallenEmbedder):
             node_embeddings = list(reversed(node_embeddings))
 
         if return_dataframe:
-            node_names = graph.get_node_names()
+            # The central and contextual embeddings share a single
+            # node names index and are wrapped without being copied.
+            node_names = pd.Index(graph.get_node_names())
             node_embeddings = [
-                pd.DataFrame(node_embedding, index=node_names)
+                pd.DataFrame(node_embedding, index=node_names, copy=False)
                 for node_embedding in node_embeddings
             ]
         return EmbeddingResult(
@@ -12,7 +12,7 @@ class NodeLabelSPINE(EnsmallenEmbedder):
 
     def __init__(
         self,
-        dtype: Optional[str] = "u8",
+        dtype: Optional[str] = None,
         maximum_depth: Optional[int] = None,
         path: Optional[str] = None,
         verbose: bool = False,
@@ -23,8 +23,12 @@ class NodeLabelSPINE(EnsmallenEmbedder):
 
         Parameters
         --------------------------
-        dtype: Optional[str] = "u8"
+        dtype: Optional[str] = None
             Dtype to use for the embedding.
+            By default, the smallest unsigned integer dtype that can
+            represent the computed distances is used, that is `u8`
+            unless some distance exceeds 255. Note that if an explicit
+            dtype is too small, the distances saturate at its maximum.
         maximum_depth: Optional[int] = None
             Maximum depth of the shortest path.
         path: Optional[str] = None
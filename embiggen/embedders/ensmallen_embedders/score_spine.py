@@ -15,7 +15,7 @@ class ScoreSPINE(EnsmallenEmbedder):
         self,
         scores: Optional[np.ndarray] = None,
         embedding_size: int = 100,
-        dtype: Optional[str] = "u8",
+        dtype: Optional[str] = None,
         maximum_depth: Optional[int] = None,
         path: Optional[str] = None,
         verbose: bool = False,
@@ -30,8 +30,12 @@ class ScoreSPINE(EnsmallenEmbedder):
             Numpy array to be used to sort the anchor nodes.
         embedding_size: int = 100
             Dimension of the embedding.
-        dtype: Optional[str] = "u8"
+        dtype: Optional[str] = None
             Dtype to use for the embedding.
+            By default, the smallest unsigned integer dtype that can
+            represent the computed distances is used, that is `u8`
+            unless some distance exceeds 255. Note that if an explicit
+            dtype is too small, the distances saturate at its maximum.
         maximum_depth: Optional[int] = None
             Maximum depth of the shortest path.
         path: Optional[str] = None
@@ -1,5 +1,5 @@
 """Submodule providing wrapper for PyKEEN's AutoSF model."""
-from typing import Union, Type, Dict, Any
+from typing import Union, Type, Dict, Any, Optional
 from pykeen.training import TrainingLoop
 from pykeen.models import AutoSF
 from embiggen.embedders.pykeen_embedders.entity_relation_embedding_model_pykeen import EntityRelationEmbeddingModelPyKEEN
@@ -14,6 +14,7 @@ class AutoSFPyKEEN(EntityRelationEmbeddingModelPyKEEN):
         num_components: int = 4,
         epochs: int = 100,
         batch_size: int = 2**10,
+        num_workers: Optional[int] = None,
         training_loop: Union[str, Type[TrainingLoop]
                              ] = "Stochastic Local Closed World Assumption",
         verbose: bool = False,
@@ -39,6 +40,8 @@ class AutoSFPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             The number of epochs to use to train the model for.
         batch_size: int = 2**10
             Size of the training batch.
+        num_workers: Optional[int] = None
+            Number of workers loading the training batches, see `PyKEENEmbedder`.
         device: str = "auto"
             The devide to use to train the model.
             Can either be cpu or cuda.
@@ -63,6 +66,7 @@ class AutoSFPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             embedding_size=embedding_size,
             epochs=epochs,
             batch_size=batch_size,
+            num_workers=num_workers,
             training_loop=training_loop,
             verbose=verbose,
             random_state=random_state,
@@ -16,6 +16,7 @@ class BoxEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
         power_norm: bool = False,
         epochs: int = 100,
         batch_size: int = 2**10,
+        num_workers: Optional[int] = None,
         training_loop: Union[str, Type[TrainingLoop]
                              ] = "Stochastic Local Closed World Assumption",
         verbose: bool = False,
@@ -47,6 +48,8 @@ class BoxEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             The number of epochs to use to train the model for.
         batch_size: int = 2**10
             Size of the training batch.
+        num_workers: Optional[int] = None
+            Number of workers loading the training batches, see `PyKEENEmbedder`.
         device: str = "auto"
             The devide to use to train the model.
             Can either be cpu or cuda.
@@ -73,6 +76,7 @@ class BoxEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             embedding_size=embedding_size,
             epochs=epochs,
             batch_size=batch_size,
+            num_workers=num_workers,
             training_loop=training_loop,
             verbose=verbose,
             random_state=random_state,
@@ -23,6 +23,7 @@ class ConvEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
         apply_batch_normalization: bool = True,
         epochs: int = 100,
         batch_size: int = 2**10,
+        num_workers: Optional[int] = None,
         training_loop: Union[str, Type[TrainingLoop]
                              ] = "Stochastic Local Closed World Assumption",
         verbose: bool = False,
@@ -69,6 +70,8 @@ class ConvEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             The number of epochs to use to train the model for.
         batch_size: int = 2**10
             Size of the training batch.
+        num_workers: Optional[int] = None
+            Number of workers loading the training batches, see `PyKEENEmbedder`.
         device: str = "auto"
             The devide to use to train the model.
             Can either be cpu or cuda.
@@ -102,6 +105,7 @@ class ConvEPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             embedding_size=embedding_size,
             epochs=epochs,
             batch_size=batch_size,
+            num_workers=num_workers,
             training_loop=training_loop,
             verbose=verbose,
             random_state=random_state,
@@ -14,6 +14,7 @@ class ERMLPPyKEEN(EntityRelationEmbeddingModelPyKEEN):
         hidden_dim: Optional[int] = None,
         epochs: int = 100,
         batch_size: int = 2**10,
+        num_workers: Optional[int] = None,
         training_loop: Union[str, Type[TrainingLoop]
                              ] = "Stochastic Local Closed World Assumption",
         verbose: bool = False,
@@ -39,6 +40,8 @@ class ERMLPPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             The number of epochs to use to train the model for.
         batch_size: int = 2**10
             Size of the training batch.
+        num_workers: Optional[int] = None
+            Number of workers loading the training batches, see `PyKEENEmbedder`.
         device: str = "auto"
             The devide to use to train the model.
             Can either be cpu or cuda.
@@ -63,6 +66,7 @@ class ERMLPPyKEEN(EntityRelationEmbeddingModelPyKEEN):
             embedding_size=embedding_size,
             epochs=epochs,
             batch_size=batch_size,
+            num_workers=num_workers,
             training_loop=training_loop,
             verbose=verbose,
             random_state=random_state,
@@ -1,5 +1,5 @@
 """Submodule providing wrapper for PyKEEN's NodePiece model."""
-from typing import Union, Type, Dict, Any, List
+from typing import Union, Type, Dict, Any, List, Optional
 from pykeen.training import TrainingLoop
 from pykeen.models import NodePiece
 from ensmallen import Graph
@@ -16,6 +16,7 @@ class NodePiecePyKEEN(EntityRelationEmbeddingModelPyKEEN):
         num_tokens: Union[int, List[int]] = 2,
         epochs: int = 100,
         batch_size: int = 2**10,
+        num_workers: Optional[int] = None,
         training_loop: Union[str, Type[TrainingLoop]
                              ] = "Stochastic Local Closed World Assumption",
         verbose: bool = False,
@@ -41,6 +42,8 @@ class NodePiecePyKEEN(EntityRelationEmbeddingModelPyKEEN):
             The number of epochs to use to train the model for.
         batch_size: int = 2**10
             Size of the training batch.
+        num_workers: Optional[int] = None
+            Number of workers loading the training batches, see `PyKEENEmbedder`.
         device: str = "auto"
             The devide to use to train the model.
             Can either be cpu or cuda.
@@ -65,6 +68,7 @@ class NodePiecePyKEEN(EntityRelationEmbeddingModelPyKEEN):
             embedding_size=embedding_size,
             epochs=epochs,
             batch_size=batch_size,
+            num_workers=num_workers,
             training_loop=training_loop,
             verbose=verbose,
             random_state=random_state,
@@ -1,5 +1,5 @@
 """Abstract Torch/PyKEEN Model wrapper for embedding models."""
-from typing import Dict, Union, Tuple, Any, Type
+from typing import Dict, Union, Tuple, Any, Type, Optional
 
 import numpy as np
 import pandas as pd
@@ -30,6 +30,7 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
         embedding_size: int = 100,
         epochs: int = 100,
         batch_size: int = 2**10,
+        num_workers: Optional[int] = None,
         device: str = "auto",
         training_loop: Union[str, Type[TrainingLoop]
                              ] = "Stochastic Local Closed World Assumption",
@@ -48,6 +49,10 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
             The number of epochs to use to train the model for.
         batch_size: int = 2**10
             Size of the training batch.
+        num_workers: Optional[int] = None
+            Number of child CPU workers used by PyKEEN's data loader
+            to load the training batches while the model trains.
+            By default, the batches are loaded in the main process.
         device: str = "auto"
             The devide to use to train the model.
             Can either be cpu or cuda.
@@ -91,6 +96,7 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
         self._epochs = epochs
         self._verbose = verbose
         self._batch_size = batch_size
+        self._num_workers = num_workers
         self._device = validate_torch_device(device)
 
         super().__init__(
@@ -114,6 +120,7 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
             **dict(
                 epochs=self._epochs,
                 batch_size=self._batch_size,
+                num_workers=self._num_workers,
             )
         )
 
@@ -186,20 +193,33 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
 
         torch_device = torch.device(self._device)
 
+        # PyKEEN stores the triples as a long tensor, so we convert the
+        # unsigned triples from Ensmallen to int64 once and share that
+        # buffer with torch, instead of copying it again into an
+        # integer tensor that PyKEEN would then have to upcast.
+        mapped_triples = torch.from_numpy(
+            graph.get_directed_edge_triples_ids().astype(np.int64)
+        )
+
+        number_of_nodes = graph.get_number_of_nodes()
+        number_of_edge_types = graph.get_number_of_edge_types()
+
         if "entity_ids" in getfullargspec(CoreTriplesFactory).args:
+            # Node and edge type IDs in Ensmallen are always dense,
+            # so we do not need to materialize them from the graph.
             triples_factory = CoreTriplesFactory(
-                torch.IntTensor(graph.get_directed_edge_triples_ids().astype(np.int64)),
-                num_entities=graph.get_number_of_nodes(),
-                num_relations=graph.get_number_of_edge_types(),
-                entity_ids=graph.get_node_ids().astype(np.int64),
-                relation_ids=graph.get_unique_edge_type_ids().astype(np.int64),
+                mapped_triples,
+                num_entities=number_of_nodes,
+                num_relations=number_of_edge_types,
+                entity_ids=np.arange(number_of_nodes, dtype=np.int64),
+                relation_ids=np.arange(number_of_edge_types, dtype=np.int64),
                 create_inverse_triples=self._create_inverse_triples(),
             )
         else:
             triples_factory = CoreTriplesFactory(
-                torch.IntTensor(graph.get_directed_edge_triples_ids().astype(np.int64)),
-                num_entities=graph.get_number_of_nodes(),
-                num_relations=graph.get_number_of_edge_types(),
+                mapped_triples,
+                num_entities=number_of_nodes,
+                num_relations=number_of_edge_types,
                 create_inverse_triples=self._create_inverse_triples(),
             )
 
@@ -230,6 +250,7 @@ class PyKEENEmbedder(AbstractEmbeddingModel):
             triples_factory=triples_factory,
             num_epochs=self._epochs,
             batch_size=batch_size,
+            num_workers=self._num_workers,
             use_tqdm=self._verbose,
             use_tqdm_batch=self._verbose,
             tqdm_kwargs=dict(
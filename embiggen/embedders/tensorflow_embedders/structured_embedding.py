@@ -22,47 +22,40 @@ class StructuredEmbeddingTensorFlow(Siamese):
     ):
         """Returns the five input tensors, unchanged."""
         edge_types = Input((1,), dtype=tf.int32, name="Edge Types")
-        source_edge_type_embedding = Reshape((
+        # The source and destination projection matrices of each edge type
+        # are stored in a single embedding, so that they are gathered at once.
+        edge_type_projections = Reshape((
+            2,
             self._embedding_size,
             self._embedding_size
         ))(FlatEmbedding(
             vocabulary_size=graph.get_number_of_edge_types(),
-            dimension=self._embedding_size*self._embedding_size,
+            dimension=2*self._embedding_size*self._embedding_size,
             input_length=1,
             mask_zero=graph.has_unknown_edge_types(),
-            name="SourceEdgeTypeEmbedding",
-        )(edge_types))
-        destination_edge_type_embedding = Reshape((
-            self._embedding_size,
-            self._embedding_size
-        ))(FlatEmbedding(
-            vocabulary_size=graph.get_number_of_edge_types(),
-            dimension=self._embedding_size*self._embedding_size,
-            input_length=1,
-            mask_zero=graph.has_unknown_edge_types(),
-            name="DestinationEdgeTypeEmbedding",
+            name="EdgeTypeProjectionEmbedding",
         )(edge_types))
+        source_edge_type_embedding = edge_type_projections[:, 0]
+        destination_edge_type_embedding = edge_type_projections[:, 1]
 
+        # Each node embedding is projected by the matrix associated to
+        # its edge type, as a batched matrix-vector product.
         return (
             edge_types,
             0.0,
-            tf.einsum(
-                'ijk,ij->ij',
+            tf.linalg.matvec(
                 source_edge_type_embedding,
                 srcs_embedding
             ),
-            tf.einsum(
-                'ijk,ij->ij',
+            tf.linalg.matvec(
                 destination_edge_type_embedding,
                 dsts_embedding
             ),
-            tf.einsum(
-                'ijk,ij->ij',
+            tf.linalg.matvec(
                 source_edge_type_embedding,
                 not_srcs_embedding
             ),
-            tf.einsum(
-                'ijk,ij->ij',
+            tf.linalg.matvec(
                 destination_edge_type_embedding,
                 not_dsts_embedding
             ),
@@ -99,16 +92,14 @@ class StructuredEmbeddingTensorFlow(Siamese):
             model,
             drop_first_row=False
         )
-        source_edge_type_embedding = self.get_layer_weights(
-            "SourceEdgeTypeEmbedding",
-            model,
-            drop_first_row=graph.has_unknown_edge_types()
-        )
-        destination_edge_type_embedding = self.get_layer_weights(
-            "DestinationEdgeTypeEmbedding",
+        edge_type_projections = self.get_layer_weights(
+            "EdgeTypeProjectionEmbedding",
             model,
             drop_first_row=graph.has_unknown_edge_types()
         )
+        projection_size = self._embedding_size*self._embedding_size
+        source_edge_type_embedding = edge_type_projections[:, :projection_size]
+        destination_edge_type_embedding = edge_type_projections[:, projection_size:]
 
         if return_dataframe:
             node_embedding = pd.DataFrame(
@@ -75,13 +75,17 @@ class TransETensorFlow(Siamese):
         )
 
         if return_dataframe:
+            # The weights retrieved from the model are freshly allocated
+            # arrays, so we wrap them without copying them once more.
             node_embedding = pd.DataFrame(
                 node_embedding,
-                index=graph.get_node_names()
+                index=graph.get_node_names(),
+                copy=False
             )
             edge_type_embedding = pd.DataFrame(
                 edge_type_embedding,
-                index=graph.get_unique_edge_type_names()
+                index=graph.get_unique_edge_type_names(),
+                copy=False
             )
 
         return EmbeddingResult(
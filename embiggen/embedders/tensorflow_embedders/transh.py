@@ -22,20 +22,17 @@ class TransHTensorFlow(Siamese):
     ):
         """Returns the five input tensors, unchanged."""
         edge_types = Input((1,), dtype=tf.int32, name="Edge Types")
-        bias_edge_type_embedding = FlatEmbedding(
+        # The bias and multiplicative embeddings of each edge type
+        # are stored in a single embedding, so that they are gathered at once.
+        edge_type_embedding = FlatEmbedding(
             vocabulary_size=graph.get_number_of_edge_types(),
-            dimension=self._embedding_size,
+            dimension=2*self._embedding_size,
             input_length=1,
             mask_zero=graph.has_unknown_edge_types(),
-            name="BiasEdgeTypeEmbedding",
-        )(edge_types)
-        multiplicative_edge_type_embedding = FlatEmbedding(
-            vocabulary_size=graph.get_number_of_edge_types(),
-            dimension=self._embedding_size,
-            input_length=1,
-            mask_zero=graph.has_unknown_edge_types(),
-            name="MultiplicativeEdgeTypeEmbedding",
+            name="EdgeTypeEmbedding",
         )(edge_types)
+        bias_edge_type_embedding = edge_type_embedding[:, :self._embedding_size]
+        multiplicative_edge_type_embedding = edge_type_embedding[:, self._embedding_size:]
 
         dot = Dot(axes=-1)([
             bias_edge_type_embedding,
@@ -97,16 +94,13 @@ class TransHTensorFlow(Siamese):
             model,
             drop_first_row=False
         )
-        bias_edge_type_embedding = self.get_layer_weights(
-            "BiasEdgeTypeEmbedding",
-            model,
-            drop_first_row=graph.has_unknown_edge_types()
-        )
-        multiplicative_edge_type_embedding = self.get_layer_weights(
-            "MultiplicativeEdgeTypeEmbedding",
+        edge_type_embedding = self.get_layer_weights(
+            "EdgeTypeEmbedding",
             model,
             drop_first_row=graph.has_unknown_edge_types()
         )
+        bias_edge_type_embedding = edge_type_embedding[:, :self._embedding_size]
+        multiplicative_edge_type_embedding = edge_type_embedding[:, self._embedding_size:]
 
         if return_dataframe:
             node_embedding = pd.DataFrame(
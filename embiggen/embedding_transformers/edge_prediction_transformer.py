@@ -181,23 +181,36 @@ class EdgePredictionTransformer:
             edge_features=negative_edge_features
         )
 
-        edge_embeddings = np.vstack([
-            positive_edge_embedding,
-            negative_edge_embedding
-        ])
-
-        edge_labels = np.concatenate([
-            np.ones(positive_edge_embedding.shape[0]),
-            np.zeros(negative_edge_embedding.shape[0])
-        ])
+        number_of_positive_samples = positive_edge_embedding.shape[0]
+        number_of_samples = number_of_positive_samples + negative_edge_embedding.shape[0]
+
+        # We allocate the output once and write the positive and negative
+        # edge embeddings directly into their final, possibly shuffled, rows,
+        # instead of stacking them and then copying them again to shuffle them.
+        edge_embeddings = np.empty(
+            shape=(number_of_samples, positive_edge_embedding.shape[1]),
+            dtype=np.result_type(positive_edge_embedding, negative_edge_embedding)
+        )
 
         if shuffle:
             numpy_random_state = np.random.RandomState(  # pylint: disable=no-member
                 seed=random_state
             )
 
-            indices = numpy_random_state.permutation(edge_labels.shape[0])
+            indices = numpy_random_state.permutation(number_of_samples)
 
-            edge_embeddings, edge_labels = edge_embeddings[indices], edge_labels[indices]
+            # The i-th shuffled sample is the indices[i]-th stacked sample,
+            # so the j-th stacked sample goes in the row positions[j].
+            positions = np.empty_like(indices)
+            positions[indices] = np.arange(number_of_samples)
+
+            edge_embeddings[positions[:number_of_positive_samples]] = positive_edge_embedding
+            edge_embeddings[positions[number_of_positive_samples:]] = negative_edge_embedding
+            edge_labels = (indices < number_of_positive_samples).astype(np.float64)
+        else:
+            edge_embeddings[:number_of_positive_samples] = positive_edge_embedding
+            edge_embeddings[number_of_positive_samples:] = negative_edge_embedding
+            edge_labels = np.zeros(number_of_samples)
+            edge_labels[:number_of_positive_samples] = 1
 
         return edge_embeddings, edge_labels
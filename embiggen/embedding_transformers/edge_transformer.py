@@ -139,12 +139,12 @@ def get_absolute_l1_edge_embedding(
     --------------------------
     Numpy array with the Absolute L1 edge embedding.
     """
-    return np.abs(
-        get_l1_edge_embedding(
-            source_node_embedding,
-            destination_node_embedding
-        )
+    edge_embedding = get_l1_edge_embedding(
+        source_node_embedding,
+        destination_node_embedding
     )
+    # We take the absolute value in place, reusing the difference buffer.
+    return np.abs(edge_embedding, out=edge_embedding)
 
 
 def get_squared_l2_edge_embedding(
@@ -164,13 +164,16 @@ def get_squared_l2_edge_embedding(
     --------------------------
     Numpy array with the Squared L2 edge embedding.
     """
-    return np.power(
-        get_l1_edge_embedding(
-            source_node_embedding,
-            destination_node_embedding
-        ),
-        2.0
+    edge_embedding = get_l1_edge_embedding(
+        source_node_embedding,
+        destination_node_embedding
     )
+    # We square in place, reusing the difference buffer. Integer
+    # features are cast to float first, as the squared L2 has always
+    # been returned as a floating point array.
+    if not np.issubdtype(edge_embedding.dtype, np.floating):
+        edge_embedding = edge_embedding.astype(np.float64)
+    return np.square(edge_embedding, out=edge_embedding)
 
 
 def get_l2_norm_edge_embedding(
@@ -188,7 +191,7 @@ def get_l2_norm_edge_embedding(
     Numpy array with the L2 norm scalar scores.
     """
     assert edge_embedding.ndim == 2
-    return np.sqrt(np.power(edge_embedding, 2.0).sum(axis=1, keepdims=True))
+    return np.sqrt(np.square(edge_embedding).sum(axis=1, keepdims=True))
 
 
 def get_l2_edge_embedding(
@@ -208,12 +211,11 @@ def get_l2_edge_embedding(
     --------------------------
     Numpy array with the L2 edge embedding.
     """
-    return np.sqrt(
-        get_squared_l2_edge_embedding(
-            source_node_embedding,
-            destination_node_embedding
-        )
+    edge_embedding = get_squared_l2_edge_embedding(
+        source_node_embedding,
+        destination_node_embedding
     )
+    return np.sqrt(edge_embedding, out=edge_embedding)
 
 
 def get_l2_distance(
@@ -233,9 +235,9 @@ def get_l2_distance(
     --------------------------
     Numpy array with the L2 distance.
     """
-    return np.sqrt(np.sum(np.power(
-        source_node_embedding - destination_node_embedding,
-        2.0
+    return np.sqrt(np.sum(get_squared_l2_edge_embedding(
+        source_node_embedding,
+        destination_node_embedding
     ), axis=1)).reshape((-1, 1))
 
 
@@ -625,16 +627,20 @@ class EdgeTransformer:
         
         edge_embeddings: List[np.ndarray] = []
         if self._transformer.is_fit():
+            # We gather the source and destination node features once,
+            # and share them across all of the requested edge embedding methods.
+            source_node_embedding = self._transformer.transform(
+                sources,
+                node_types=source_node_types
+            )
+            destination_node_embedding = self._transformer.transform(
+                destinations,
+                node_types=destination_node_types
+            )
             for method in self._methods:
                 edge_embedding = method(
-                    self._transformer.transform(
-                        sources,
-                        node_types=source_node_types
-                    ),
-                    self._transformer.transform(
-                        destinations,
-                        node_types=destination_node_types
-                    )
+                    source_node_embedding,
+                    destination_node_embedding
                 )
                 assert not np.isnan(edge_embedding).any(), (
                     "The provided edge embedding should not have NaN values, but we got "
@@ -700,6 +706,16 @@ class EdgeTransformer:
                     )
 
 
+        # When a single edge embedding method is requested and there are no
+        # other features, the edge embedding was freshly computed above and
+        # we can return it as is, without copying it into a new array.
+        if (
+            len(edge_embeddings) == 1 and
+            len(edge_features) == 0 and
+            len(edge_type_features) == 0
+        ):
+            return edge_embeddings[0].reshape((expected_shape, -1))
+
         result = np.hstack([
             *[
                 edge_embedding.reshape((expected_shape, -1))
@@ -201,17 +201,37 @@ class NodeTransformer:
                             node_types[node]
                             for node in nodes
                         ]
-                node_type_feature_dimensionality = self._node_type_feature.shape[1]
-                node_type_features = np.vstack([
-                    np.mean(
-                        self._node_type_feature[node_type_ids],
-                        axis=0
-                    )
-                    if node_type_ids is not None
-                    else
-                    np.zeros(shape=node_type_feature_dimensionality)
-                    for node_type_ids in node_types
-                ])
+                # We gather the features of all the node types at once and
+                # average them per node with a single segmented reduction,
+                # leaving to zero the rows of nodes with unknown node types.
+                # Means of integer features, such as the SPINE embeddings,
+                # are not integers, so we sum and average them in floats.
+                dtype = np.result_type(self._node_type_feature.dtype, np.float32)
+                number_of_node_types = np.fromiter(
+                    (
+                        0 if node_type_ids is None else len(node_type_ids)
+                        for node_type_ids in node_types
+                    ),
+                    dtype=np.int64,
+                    count=len(node_types)
+                )
+                node_type_features = np.zeros(
+                    shape=(len(node_types), self._node_type_feature.shape[1]),
+                    dtype=dtype
+                )
+                has_node_types = number_of_node_types > 0
+                if has_node_types.any():
+                    counts = number_of_node_types[has_node_types]
+                    node_type_features[has_node_types] = np.add.reduceat(
+                        self._node_type_feature[np.concatenate([
+                            node_type_ids
+                            for node_type_ids in node_types
+                            if node_type_ids is not None and len(node_type_ids) > 0
+                        ])],
+                        np.cumsum(counts) - counts,
+                        axis=0,
+                        dtype=dtype
+                    ) / counts.reshape((-1, 1))
         else:
             if nodes is not None and self.has_node_features():
                 if isinstance(nodes, Graph):
@@ -1,8 +1,7 @@
 """Submodule providing element-wise L1 distance layer."""
 from typing import Tuple, Dict
 import tensorflow as tf
-from tensorflow.keras import backend as K
-from tensorflow.keras.layers import Subtract, Lambda, Layer  # pylint: disable=import-error,no-name-in-module
+from tensorflow.keras.layers import Layer  # pylint: disable=import-error,no-name-in-module
 
 
 class ElementWiseL1(Layer):
@@ -20,23 +19,12 @@ class ElementWiseL1(Layer):
             Kwargs to pass to the parent Layer class.
         """
         super().__init__(**kwargs)
-        self._subtraction = None
-        self._absolute_value = None
-
-    def build(self, input_shape) -> None:
-        """Build the element-wise L1 distance layer.
-
-        Parameters
-        ------------------------------
-        input_shape
-            Shape of the output of the previous layer.
-        """
-        self._subtraction = Subtract()
-        self._absolute_value = Lambda(K.abs)
-        super().build(input_shape)
 
     def call(
         self,
         inputs: Tuple[tf.Tensor],
     ) -> tf.Tensor:
-        return self._absolute_value(self._subtraction(inputs))
+        # We compute the difference and its absolute value within this layer,
+        # instead of chaining two separate Keras layers.
+        left, right = inputs
+        return tf.abs(left - right)
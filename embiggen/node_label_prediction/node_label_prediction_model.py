@@ -6,6 +6,10 @@ import warnings
 from ensmallen import Graph
 from embiggen.utils.abstract_models import AbstractClassifierModel, abstract_class
 
+_MONTE_CARLO_EVALUATION_SCHEMAS = frozenset(("Stratified Monte Carlo", "Monte Carlo"))
+_KFOLD_EVALUATION_SCHEMAS = frozenset(("Stratified Kfold", "Kfold"))
+_STRATIFIED_EVALUATION_SCHEMAS = frozenset(("Stratified Monte Carlo", "Stratified Kfold"))
+
 
 @abstract_class
 class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
@@ -82,17 +86,17 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
         holdouts_kwargs: Dict[str, Any]
             The kwargs to be forwarded to the holdout method.
         """
-        if evaluation_schema in ("Stratified Monte Carlo", "Monte Carlo"):
+        if evaluation_schema in _MONTE_CARLO_EVALUATION_SCHEMAS:
             return graph.get_node_label_holdout_graphs(
                 **holdouts_kwargs,
-                use_stratification="Stratified" in evaluation_schema,
+                use_stratification=evaluation_schema in _STRATIFIED_EVALUATION_SCHEMAS,
                 random_state=random_state+holdout_number,
             )
-        if evaluation_schema in ("Kfold", "Stratified Kfold"):
+        if evaluation_schema in _KFOLD_EVALUATION_SCHEMAS:
             return graph.get_node_label_kfold(
                 k=number_of_holdouts,
                 k_index=holdout_number,
-                use_stratification="Stratified" in evaluation_schema,
+                use_stratification=evaluation_schema in _STRATIFIED_EVALUATION_SCHEMAS,
                 random_state=random_state,
             )
         super().split_graph_following_evaluation_schema(
@@ -137,12 +141,10 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
         train_size = train.get_number_of_known_node_types(
         ) / graph.get_number_of_known_node_types()
 
-        if self.is_multilabel_prediction_task():
-            labels = graph.get_one_hot_encoded_node_types()
-        elif self.is_binary_prediction_task():
-            labels = graph.get_boolean_node_type_ids()
-        else:
-            labels = graph.get_single_label_node_type_ids()
+        # The kind of prediction task is fixed once the model is fit,
+        # so we determine it once for both the train and test evaluations.
+        is_binary_prediction_task = self.is_binary_prediction_task()
+        is_multilabel_prediction_task = self.is_multilabel_prediction_task()
 
         performance = []
         for evaluation_mode, evaluation_graph in (
@@ -158,12 +160,30 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
                 edge_features=edge_features
             )
 
-            if self.is_binary_prediction_task():
+            # We restrict the predictions to the nodes with known node types
+            # before deriving the predicted labels, so that the thresholding
+            # and argmax only run over the rows that are evaluated.
+            mask = evaluation_graph.get_known_node_types_mask()
+            prediction_probabilities = prediction_probabilities[mask]
+
+            # The labels are retrieved directly for the known nodes of the
+            # evaluation graph, in the same order as the masked predictions,
+            # instead of being built for the whole graph and then masked.
+            if is_multilabel_prediction_task:
+                labels = evaluation_graph.get_one_hot_encoded_known_node_types()
+            elif is_binary_prediction_task:
+                labels = evaluation_graph.get_known_boolean_node_type_ids(
+                    target_value=1
+                )
+            else:
+                labels = evaluation_graph.get_known_single_label_node_type_ids()
+
+            if is_binary_prediction_task:
                 if prediction_probabilities.shape[1] == 1:
                     predictions = prediction_probabilities
                 elif prediction_probabilities.shape[1] == 2:
-                    predictions = prediction_probabilities[:, 1]
                     prediction_probabilities = prediction_probabilities[:, 1]
+                    predictions = prediction_probabilities
                 else:
                     raise NotImplementedError(
                         f"The model {self.model_name()} as implemented in "
@@ -174,26 +194,21 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
                         "Please open an issue and pull request to clarify what "
                         "you expect to happen here."
                     )
-            elif self.is_multilabel_prediction_task():
+            elif is_multilabel_prediction_task:
                 predictions = prediction_probabilities > 0.5
             else:
                 predictions = prediction_probabilities.argmax(axis=-1)
 
-            mask = evaluation_graph.get_known_node_types_mask()
-            prediction_probabilities = prediction_probabilities[mask]
-            predictions = predictions[mask]
-            labels_subset = labels[mask]
-
             performance.append({
                 "evaluation_mode": evaluation_mode,
                 "train_size": train_size,
                 "known_nodes_number": evaluation_graph.get_number_of_known_node_types(),
                 **self.evaluate_predictions(
-                    labels_subset,
+                    labels,
                     predictions,
                 ),
                 **self.evaluate_prediction_probabilities(
-                    labels_subset,
+                    labels,
                     prediction_probabilities,
                 ),
             })
@@ -238,11 +253,20 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
             If node type features are provided.
             If edge type features are provided.
         """
-        non_zero_node_types = sum([
-            1
-            for count in graph.get_node_type_names_counts_hashmap().values()
-            if count > 0
-        ])
+        node_type_counts = graph.get_node_type_names_counts_hashmap()
+
+        # We find the number of non-zero node types and the most and least
+        # common node types with a single scan of the node type counts.
+        non_zero_node_types = 0
+        most_common_node_type_name = least_common_node_type_name = None
+        most_common_count = least_common_count = None
+        for node_type_name, count in node_type_counts.items():
+            if count > 0:
+                non_zero_node_types += 1
+            if most_common_count is None or count > most_common_count:
+                most_common_node_type_name, most_common_count = node_type_name, count
+            if least_common_count is None or count < least_common_count:
+                least_common_node_type_name, least_common_count = node_type_name, count
 
         if non_zero_node_types < 2:
             raise ValueError(
@@ -253,16 +277,6 @@ class AbstractNodeLabelPredictionModel(AbstractClassifierModel):
         self._is_binary_prediction_task = non_zero_node_types == 2
         self._is_multilabel_prediction_task = graph.has_multilabel_node_types()
 
-        node_type_counts = graph.get_node_type_names_counts_hashmap()
-        most_common_node_type_name, most_common_count = max(
-            node_type_counts.items(),
-            key=lambda x: x[1]
-        )
-        least_common_node_type_name, least_common_count = min(
-            node_type_counts.items(),
-            key=lambda x: x[1]
-        )
-
         if most_common_count > least_common_count * 20:
             warnings.warn(
                 "Please do be advised that this graph defines "
@@ -4,6 +4,7 @@ from sklearn.ensemble import RandomForestClassifier
 from multiprocessing import cpu_count
 from embiggen.node_label_prediction.node_label_prediction_sklearn.decision_tree_node_label_prediction import DecisionTreeNodeLabelPrediction
 from embiggen.node_label_prediction.node_label_prediction_sklearn.sklearn_node_label_prediction_adapter import SklearnNodeLabelPredictionAdapter
+from embiggen.utils.normalize_kwargs import normalize_kwargs
 
 
 class RandomForestNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
@@ -31,26 +32,9 @@ class RandomForestNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         random_state: int = 42
     ):
         """Create the Random Forest for Edge  Prediction."""
-        self._n_estimators = n_estimators
-        self._criterion = criterion
-        self._max_depth = max_depth
-        self._min_samples_split = min_samples_split
-        self._min_samples_leaf = min_samples_leaf
-        self._min_weight_fraction_leaf = min_weight_fraction_leaf
-        self._max_features = max_features
-        self._max_leaf_nodes = max_leaf_nodes
-        self._min_impurity_decrease = min_impurity_decrease
-        self._bootstrap = bootstrap
-        self._oob_score = oob_score
-        self._n_jobs = cpu_count() if n_jobs == -1 else n_jobs
-        self._verbose = verbose
-        self._warm_start = warm_start
-        self._class_weight = class_weight
-        self._ccp_alpha = ccp_alpha
-        self._max_samples = max_samples
-
-        super().__init__(
-            RandomForestClassifier(
+        self._random_forest_kwargs = normalize_kwargs(
+            self,
+            dict(
                 n_estimators=n_estimators,
                 criterion=criterion,
                 max_depth=max_depth,
@@ -62,13 +46,19 @@ class RandomForestNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
                 min_impurity_decrease=min_impurity_decrease,
                 bootstrap=bootstrap,
                 oob_score=oob_score,
-                n_jobs=n_jobs,
-                random_state=random_state,
+                n_jobs=cpu_count() if n_jobs == -1 else n_jobs,
                 verbose=verbose,
                 warm_start=warm_start,
                 class_weight=class_weight,
                 ccp_alpha=ccp_alpha,
-                max_samples=max_samples
+                max_samples=max_samples,
+            )
+        )
+
+        super().__init__(
+            RandomForestClassifier(
+                **self._random_forest_kwargs,
+                random_state=random_state
             ),
             random_state
         )
@@ -85,25 +75,7 @@ class RandomForestNodeLabelPrediction(SklearnNodeLabelPredictionAdapter):
         """Returns parameters used for this model."""
         return {
             **super().parameters(),
-            **dict(
-                n_estimators = self._n_estimators,
-                criterion = self._criterion,
-                max_depth = self._max_depth,
-                min_samples_split = self._min_samples_split,
-                min_samples_leaf = self._min_samples_leaf,
-                min_weight_fraction_leaf = self._min_weight_fraction_leaf,
-                max_features = self._max_features,
-                max_leaf_nodes = self._max_leaf_nodes,
-                min_impurity_decrease = self._min_impurity_decrease,
-                bootstrap = self._bootstrap,
-                oob_score = self._oob_score,
-                n_jobs = self._n_jobs,
-                verbose = self._verbose,
-                warm_start = self._warm_start,
-                class_weight = self._class_weight,
-                ccp_alpha = self._ccp_alpha,
-                max_samples = self._max_samples,
-            )
+            **self._random_forest_kwargs
         }
 
     @classmethod
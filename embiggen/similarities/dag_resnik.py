@@ -6,6 +6,16 @@ from ensmallen import models, Graph
 
 class DAGResnik:
 
+    # Mapping from the kind of elements defining a bipartite graph to the
+    # type of a single such element and the model method to call.
+    BIPARTITE_SIMILARITY_METHODS = {
+        "node_ids": (int, "get_node_ids_and_similarity_from_node_ids"),
+        "node_names": (str, "get_node_ids_and_similarity_from_node_names"),
+        "node_prefixes": (str, "get_node_ids_and_similarity_from_node_prefixes"),
+        "node_type_ids": (int, "get_node_ids_and_similarity_from_node_type_ids"),
+        "node_type_names": (str, "get_node_ids_and_similarity_from_node_type_names"),
+    }
+
     def __init__(self, verbose: bool = True):
         """Create new Resnik similarity model."""
         self._model = models.DAGResnik(verbose)
@@ -68,6 +78,8 @@ class DAGResnik:
         if not return_similarities_dataframe:
             return (edge_node_ids, similarities)
 
+        # The node IDs and scores are freshly returned by the model,
+        # so we wrap them without copying them into the DataFrame.
         return pd.DataFrame({
             "source": (
                 self._graph.get_node_names_from_node_ids(edge_node_ids[:, 0])
@@ -80,7 +92,54 @@ class DAGResnik:
                 else edge_node_ids[:, 1]
             ),
             "resnik_score": similarities
-        })
+        }, copy=False)
+
+    def _get_similarities_from_bipartite_graph(
+        self,
+        kind: str,
+        sources: Union[List[str], List[int]],
+        destinations: Union[List[str], List[int]],
+        minimum_similarity: Optional[float] = 0.0,
+        return_similarities_dataframe: bool = False,
+        return_node_names: bool = False
+    ) -> Union[pd.DataFrame, Tuple[np.ndarray, np.ndarray]]:
+        """Execute similarities on the bipartite portion defined by the given kind of elements.
+
+        Parameters
+        --------------------
+        kind: str
+            The kind of elements defining the bipartite graph,
+            one of the keys of `BIPARTITE_SIMILARITY_METHODS`.
+        sources: Union[List[str], List[int]]
+            The source elements defining a bipartite graph.
+        destinations: Union[List[str], List[int]]
+            The destination elements defining a bipartite graph.
+        minimum_similarity: Optional[float] = 0.0
+            Minimum similarity to be kept. Values below this amount are filtered.
+        return_similarities_dataframe: bool = False
+            Whether to return a pandas DataFrame, which as indices has the node IDs.
+            By default, a numpy array with the similarities is returned as requires much less RAM.
+        return_node_names: bool = False
+            Whether to return the node names or node IDs associated to the scores.
+            By default we return the node ids, which require much less memory.
+        """
+        element_type, method_name = self.BIPARTITE_SIMILARITY_METHODS[kind]
+
+        if isinstance(sources, element_type):
+            sources = [sources]
+
+        if isinstance(destinations, element_type):
+            destinations = [destinations]
+
+        return self._normalize_output(
+            *getattr(self._model, method_name)(
+                sources,
+                destinations,
+                minimum_similarity=minimum_similarity
+            ),
+            return_similarities_dataframe=return_similarities_dataframe,
+            return_node_names=return_node_names
+        )
 
     def get_similarities_from_bipartite_graph_node_ids(
         self,
@@ -107,18 +166,11 @@ class DAGResnik:
             Whether to return the node names or node IDs associated to the scores.
             By default we return the node ids, which require much less memory.
         """
-        if isinstance(source_node_ids, int):
-            source_node_ids = [source_node_ids]
-
-        if isinstance(destination_node_ids, int):
-            destination_node_ids = [destination_node_ids]
-        
-        return self._normalize_output(
-            *self._model.get_node_ids_and_similarity_from_node_ids(
-                first_node_ids=source_node_ids,
-                second_node_ids=destination_node_ids,
-                minimum_similarity=minimum_similarity
-            ),
+        return self._get_similarities_from_bipartite_graph(
+            "node_ids",
+            source_node_ids,
+            destination_node_ids,
+            minimum_similarity=minimum_similarity,
             return_similarities_dataframe=return_similarities_dataframe,
             return_node_names=return_node_names
         )
@@ -148,18 +200,11 @@ class DAGResnik:
             Whether to return the node names or node IDs associated to the scores.
             By default we return the node ids, which require much less memory.
         """
-        if isinstance(source_node_names, str):
-            source_node_names = [source_node_names]
-
-        if isinstance(destination_node_names, str):
-            destination_node_names = [destination_node_names]
-        
-        return self._normalize_output(
-            *self._model.get_node_ids_and_similarity_from_node_names(
-                first_node_names=source_node_names,
-                second_node_names=destination_node_names,
-                minimum_similarity=minimum_similarity
-            ),
+        return self._get_similarities_from_bipartite_graph(
+            "node_names",
+            source_node_names,
+            destination_node_names,
+            minimum_similarity=minimum_similarity,
             return_similarities_dataframe=return_similarities_dataframe,
             return_node_names=return_node_names
         )
@@ -189,18 +234,11 @@ class DAGResnik:
             Whether to return the node names or node IDs associated to the scores.
             By default we return the node ids, which require much less memory.
         """
-        if isinstance(source_node_prefixes, str):
-            source_node_prefixes = [source_node_prefixes]
-
-        if isinstance(destination_node_prefixes, str):
-            destination_node_prefixes = [destination_node_prefixes]
-        
-        return self._normalize_output(
-            *self._model.get_node_ids_and_similarity_from_node_prefixes(
-                first_node_prefixes=source_node_prefixes,
-                second_node_prefixes=destination_node_prefixes,
-                minimum_similarity=minimum_similarity
-            ),
+        return self._get_similarities_from_bipartite_graph(
+            "node_prefixes",
+            source_node_prefixes,
+            destination_node_prefixes,
+            minimum_similarity=minimum_similarity,
             return_similarities_dataframe=return_similarities_dataframe,
             return_node_names=return_node_names
         )
@@ -230,18 +268,11 @@ class DAGResnik:
             Whether to return the node names or node IDs associated to the scores.
             By default we return the node ids, which require much less memory.
         """
-        if isinstance(source_node_type_ids, int):
-            source_node_type_ids = [source_node_type_ids]
-
-        if isinstance(destination_node_type_ids, int):
-            destination_node_type_ids = [destination_node_type_ids]
-        
-        return self._normalize_output(
-            *self._model.get_node_ids_and_similarity_from_node_type_ids(
-                first_node_type_ids=source_node_type_ids,
-                second_node_type_ids=destination_node_type_ids,
-                minimum_similarity=minimum_similarity
-            ),
+        return self._get_similarities_from_bipartite_graph(
+            "node_type_ids",
+            source_node_type_ids,
+            destination_node_type_ids,
+            minimum_similarity=minimum_similarity,
             return_similarities_dataframe=return_similarities_dataframe,
             return_node_names=return_node_names
         )
@@ -271,18 +302,11 @@ class DAGResnik:
             Whether to return the node names or node IDs associated to the scores.
             By default we return the node ids, which require much less memory.
         """
-        if isinstance(source_node_type_names, str):
-            source_node_type_names = [source_node_type_names]
-
-        if isinstance(destination_node_type_names, str):
-            destination_node_type_names = [destination_node_type_names]
-
-        return self._normalize_output(
-            *self._model.get_node_ids_and_similarity_from_node_type_names(
-                first_node_type_names=source_node_type_names,
-                second_node_type_names=destination_node_type_names,
-                minimum_similarity=minimum_similarity
-            ),
+        return self._get_similarities_from_bipartite_graph(
+            "node_type_names",
+            source_node_type_names,
+            destination_node_type_names,
+            minimum_similarity=minimum_similarity,
             return_similarities_dataframe=return_similarities_dataframe,
             return_node_names=return_node_names
         )
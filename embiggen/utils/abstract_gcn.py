@@ -168,15 +168,27 @@ def graph_to_sparse_tensor(
         raise ValueError(
             f"The provided graph contains {number_of_zeros} zeros in the kernel weights."
         )
-    
-    return tf.sparse.reorder(
-        tf.SparseTensor(
-            edge_node_ids,
-            kernel_weights,
-            (graph.get_number_of_nodes(), graph.get_number_of_nodes()),
-        )
+
+    sparse_tensor = tf.SparseTensor(
+        edge_node_ids,
+        kernel_weights,
+        (graph.get_number_of_nodes(), graph.get_number_of_nodes()),
     )
 
+    # The parallel edges have been dropped above, and Ensmallen usually
+    # returns the directed edges sorted by source and destination. We only
+    # skip the reorder when the indices are verifiably in strictly increasing
+    # row-major order, which is a linear check instead of a sort.
+    if kernel == "Weights":
+        linear_edge_ids = (
+            edge_node_ids[:, 0].astype(np.int64) * graph.get_number_of_nodes()
+            + edge_node_ids[:, 1]
+        )
+        if np.all(linear_edge_ids[1:] > linear_edge_ids[:-1]):
+            return sparse_tensor
+
+    return tf.sparse.reorder(sparse_tensor)
+
 
 @abstract_class
 class AbstractGCN(AbstractClassifierModel):
@@ -2329,43 +2329,38 @@ class AbstractClassifierModel(AbstractModel):
 
         time_required_for_evaluation = time.time() - start_evaluation
 
-        model_performance["time_required_for_training"] = time_required_for_training
-        model_performance["time_required_for_evaluation"] = time_required_for_evaluation
-        model_performance["time"] = time.time()
-        model_performance["task_name"] = self.task_name()
-        model_performance["model_name"] = self.model_name()
-        model_performance["library_name"] = self.library_name()
-        model_performance["graph_name"] = graph.get_name()
-        model_performance["nodes_number"] = graph.get_number_of_nodes()
-        model_performance["edges_number"] = graph.get_number_of_directed_edges()
-        model_performance["evaluation_schema"] = evaluation_schema
-        model_performance["holdout_number"] = holdout_number
-        model_performance["holdouts_kwargs"] = json.dumps(holdouts_kwargs)
-        model_performance["use_subgraph_as_support"] = use_subgraph_as_support
-        model_performance["node_feature_shapes"] = json.dumps([self._node_feature_shapes])
-        model_performance["node_type_feature_shapes"] = json.dumps([self._node_type_feature_shapes])
-        model_performance["edge_type_feature_shapes"] = json.dumps([self._edge_type_feature_shapes])
-
-        for column_name, column_value in metadata.items():
-            model_performance[column_name] = column_value
-
-        df_model_parameters = pd.DataFrame(dict(), index=model_performance.index)
-        df_features_parameters = pd.DataFrame(dict(), index=model_performance.index)
+        # We add the constant columns all at once, as inserting them
+        # one by one fragments the underlying blocks of the dataframe.
+        model_performance = model_performance.assign(
+            time_required_for_training=time_required_for_training,
+            time_required_for_evaluation=time_required_for_evaluation,
+            time=time.time(),
+            task_name=self.task_name(),
+            model_name=self.model_name(),
+            library_name=self.library_name(),
+            graph_name=graph.get_name(),
+            nodes_number=graph.get_number_of_nodes(),
+            edges_number=graph.get_number_of_directed_edges(),
+            evaluation_schema=evaluation_schema,
+            holdout_number=holdout_number,
+            holdouts_kwargs=json.dumps(holdouts_kwargs),
+            use_subgraph_as_support=use_subgraph_as_support,
+            node_feature_shapes=json.dumps([self._node_feature_shapes]),
+            node_type_feature_shapes=json.dumps([self._node_type_feature_shapes]),
+            edge_type_feature_shapes=json.dumps([self._edge_type_feature_shapes]),
+            **metadata,
+            features_names=format_list(features_names),
+        )
 
+        model_parameters = {}
         for parameter_name, parameter_value in self.parameters().items():
             if isinstance(parameter_value, (list, tuple)):
                 parameter_value = str(parameter_value)
-            df_model_parameters[parameter_name] = parameter_value
-
-        df_model_parameters.columns = [
-            ["model_parameters"] * len(df_model_parameters.columns),
-            df_model_parameters.columns,
-        ]
-
-        model_performance["features_names"] = format_list(features_names)
+            model_parameters[("model_parameters", parameter_name)] = parameter_value
 
+        features_parameters_columns = {}
         for parameter, value in features_parameters.items():
-            if parameter in df_features_parameters.columns:
+            if ("features_parameters", parameter) in features_parameters_columns:
                 raise ValueError(
                     "There has been a collision between the parameters used in "
                     "one of the embedding models and the parameter "
@@ -2373,12 +2368,16 @@ class AbstractClassifierModel(AbstractModel):
                     f"The parameter that has caused the collision is {parameter}. "
                     "Please do change the name of the parameter in your model."
                 )
-            df_features_parameters[parameter] = str(value)
+            features_parameters_columns[("features_parameters", parameter)] = str(value)
 
-        df_features_parameters.columns = [
-            ["features_parameters"] * len(df_features_parameters.columns),
-            df_features_parameters.columns,
-        ]
+        df_model_parameters = pd.DataFrame(
+            model_parameters,
+            index=model_performance.index
+        )
+        df_features_parameters = pd.DataFrame(
+            features_parameters_columns,
+            index=model_performance.index
+        )
 
         model_performance = pd.concat(
             [model_performance, df_model_parameters, df_features_parameters], axis=1
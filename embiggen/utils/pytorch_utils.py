@@ -1,6 +1,9 @@
 """Submodule with utilities for pytorch models."""
+from functools import lru_cache
 import torch
 
+
+@lru_cache(maxsize=None)
 def validate_torch_device(device: str) -> str:
     """Validate and sanitize torch device name.
     
@@ -8,17 +11,26 @@ def validate_torch_device(device: str) -> str:
     ------------------------
     device: str
         The device to use with Torch.
-        This can either be `cuda`, `gpu`, or `auto`.
+        This can either be `cpu`, `cuda`, `cuda:N` to select
+        the N-th CUDA device, `mps`, or `auto`.
 
     Raises
     ------------------------
     ValueError
-        If the device is not either cpu or cuda.
+        If the device is not either cpu, cuda, cuda:N or mps.
     ValueError
         If cuda was requested but CUDA is not available.
+    ValueError
+        If the requested CUDA device index is not available.
+    ValueError
+        If mps was requested but MPS is not available.
     """
+    # We query CUDA only once, as the availability of the devices
+    # does not change during the lifetime of the process and every
+    # model instantiation goes through this validation.
+    cuda_is_available = torch.cuda.is_available()
 
-    if torch.cuda.is_available():
+    if cuda_is_available:
         cuda_comment = (
             "Your Torch installation does detect CUDA "
             "installed in your system. Do consider using `cuda` "
@@ -34,19 +46,46 @@ def validate_torch_device(device: str) -> str:
         if device == "auto":
             device = "cpu"
     
-    if device not in ("cpu", "cuda"):
+    # A specific CUDA device may be requested as `cuda:N`.
+    device_name, separator, device_index = device.partition(":")
+
+    if (
+        device_name not in ("cpu", "cuda", "mps") or
+        separator and (device_name != "cuda" or not device_index.isdigit())
+    ):
         raise ValueError(
             f"The provided torch device `{device}` is not a supported "
             "torch device. Currently, the supported torch devices are "
-            f"cpu and cuda, or `auto` for auto-dispatching. {cuda_comment}"
+            "cpu, cuda, cuda:N to select a specific CUDA device, and mps, "
+            f"or `auto` for auto-dispatching. {cuda_comment}"
         )
         
-    if device == "cuda" and not torch.cuda.is_available():
+    if device_name == "cuda" and not cuda_is_available:
         raise ValueError(
-            f"{cuda_comment} You have provided as device `cuda`. "
+            f"{cuda_comment} You have provided as device `{device}`. "
             "Either use `cpu` or ensure you have a working GPU "
             "and CUDA is installed and has a version compatible "
             "with the version of Torch you have installed."
         )
+
+    if separator and int(device_index) >= torch.cuda.device_count():
+        raise ValueError(
+            f"You have provided as device `{device}`, but Torch only "
+            f"detects {torch.cuda.device_count()} CUDA devices, that is "
+            f"the devices from `cuda:0` to `cuda:{torch.cuda.device_count() - 1}`."
+        )
+
+    # Versions of Torch older than 1.12 do not have an MPS backend at all,
+    # which we treat as the backend not being available.
+    mps_backend = getattr(torch.backends, "mps", None)
+    if device_name == "mps" and (
+        mps_backend is None or not mps_backend.is_available()
+    ):
+        raise ValueError(
+            "You have provided as device `mps`, but your Torch installation "
+            "is not currently able to detect an MPS device. The MPS backend "
+            "requires an Apple Silicon system and a version of Torch "
+            "that was built with MPS support."
+        )
     
     return device
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from ensmallen import Graph
+from embiggen.edge_prediction import DecisionTreeEdgePrediction
+from unittest import TestCase
+
+
+class TestDecisionTreeEdgePrediction(TestCase):
+
+    def setUp(self):
+        self._graph = Graph.generate_random_connected_graph(
+            random_state=100,
+            number_of_nodes=100,
+        )
+        self._node_features = np.random.RandomState(42).uniform(
+            size=(self._graph.get_number_of_nodes(), 8)
+        )
+
+    def _predict_proba(self, n_jobs: int) -> np.ndarray:
+        model = DecisionTreeEdgePrediction(
+            prediction_batch_size=16,
+            n_jobs=n_jobs,
+        )
+        model.fit(self._graph, node_features=self._node_features)
+        return model.predict_proba(
+            self._graph,
+            node_features=self._node_features,
+            return_predictions_dataframe=False,
+        )
+
+    def test_threaded_predictions_match_sequential_ones(self):
+        sequential_predictions = self._predict_proba(n_jobs=1)
+        for n_jobs in (2, 4, -1, -2):
+            self.assertTrue(np.array_equal(
+                sequential_predictions,
+                self._predict_proba(n_jobs=n_jobs)
+            ))
+
+    def test_n_jobs_is_validated(self):
+        with pytest.raises(ValueError):
+            DecisionTreeEdgePrediction(n_jobs=0)
+        self.assertEqual(
+            DecisionTreeEdgePrediction(n_jobs=4).parameters()["n_jobs"],
+            4
+        )
@@ -0,0 +1,33 @@
+import numpy as np
+try:
+    import tensorflow as tf
+    from ensmallen import Graph
+    from embiggen.utils.abstract_gcn import graph_to_sparse_tensor
+    from unittest import TestCase
+
+
+    class TestGraphToSparseTensor(TestCase):
+
+        def setUp(self):
+            self._graph = Graph.generate_random_connected_graph(
+                random_state=100,
+                number_of_nodes=100,
+                weight=2.0,
+            )
+
+        def test_weights_kernel_is_in_canonical_order(self):
+            sparse_tensor = graph_to_sparse_tensor(
+                self._graph,
+                kernel="Weights",
+            )
+            reordered_sparse_tensor = tf.sparse.reorder(sparse_tensor)
+            self.assertTrue(np.array_equal(
+                sparse_tensor.indices.numpy(),
+                reordered_sparse_tensor.indices.numpy()
+            ))
+            self.assertTrue(np.array_equal(
+                sparse_tensor.values.numpy(),
+                reordered_sparse_tensor.values.numpy()
+            ))
+except ModuleNotFoundError:
+    pass
@@ -0,0 +1,46 @@
+import numpy as np
+try:
+    from ensmallen import Graph
+    from embiggen.sequences.tensorflow_sequences import Node2VecSequence
+    from unittest import TestCase
+
+
+    class TestNode2VecSequence(TestCase):
+
+        def setUp(self):
+            self._graph = Graph.generate_random_connected_graph(
+                random_state=100,
+                number_of_nodes=100,
+            )
+            self._batch_size = 8
+            self._iterations = 2
+            self._walk_length = 16
+            self._window_size = 2
+            self._sequence = Node2VecSequence(
+                self._graph,
+                walk_length=self._walk_length,
+                batch_size=self._batch_size,
+                iterations=self._iterations,
+                window_size=self._window_size,
+            )
+
+        def test_batch_shape_and_layout(self):
+            contexts, words = self._sequence[0][0][0]
+            number_of_skipgrams = self._batch_size * self._iterations * (
+                self._walk_length - self._window_size * 2
+            )
+            self.assertEqual(
+                contexts.shape,
+                (number_of_skipgrams, self._window_size * 2)
+            )
+            self.assertEqual(words.shape, (number_of_skipgrams, ))
+            self.assertTrue(contexts.flags["C_CONTIGUOUS"])
+            self.assertTrue(words.flags["C_CONTIGUOUS"])
+
+        def test_batches_do_not_share_buffers(self):
+            previous_contexts, previous_words = self._sequence[0][0][0]
+            contexts, words = self._sequence[1][0][0]
+            self.assertFalse(np.shares_memory(previous_contexts, contexts))
+            self.assertFalse(np.shares_memory(previous_words, words))
+except ModuleNotFoundError:
+    pass
@@ -0,0 +1,38 @@
+import numpy as np
+from embiggen.embedding_transformers import NodeTransformer
+from unittest import TestCase
+
+
+class TestNodeTransformer(TestCase):
+
+    def setUp(self):
+        self._node_types = [[0, 1], None, [2], [0, 1, 2]]
+
+    def _transform(self, node_type_feature: np.ndarray) -> np.ndarray:
+        transformer = NodeTransformer(aligned_mapping=True)
+        transformer.fit(node_type_feature=node_type_feature)
+        return transformer.transform(node_types=self._node_types)
+
+    def test_node_type_features_are_averaged(self):
+        node_type_feature = np.array(
+            [[0.5, 1.0], [1.5, 2.0], [3.0, 4.0]],
+            dtype=np.float32
+        )
+        node_type_features = self._transform(node_type_feature)
+        self.assertEqual(node_type_features.dtype, np.float32)
+        self.assertTrue(np.allclose(
+            node_type_features,
+            [[1.0, 1.5], [0.0, 0.0], [3.0, 4.0], [5.0 / 3.0, 7.0 / 3.0]]
+        ))
+
+    def test_integer_node_type_features_are_averaged_in_floats(self):
+        node_type_feature = np.array(
+            [[200, 7], [250, 8], [3, 4]],
+            dtype=np.uint8
+        )
+        node_type_features = self._transform(node_type_feature)
+        self.assertTrue(np.issubdtype(node_type_features.dtype, np.floating))
+        self.assertTrue(np.allclose(
+            node_type_features,
+            [[225.0, 7.5], [0.0, 0.0], [3.0, 4.0], [151.0, 19.0 / 3.0]]
+        ))